@@ -17,27 +17,50 @@ import os
 import sqlite3
 import threading
 import time
-import wave
 import hashlib
 import logging
+import random
+from collections import OrderedDict
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List, Callable
-import tempfile
-import json
 
 # Third-party imports
-import sounddevice as sd
-import numpy as np
-from scipy.io import wavfile
-import edge_tts
 # 移除语音识别依赖，专注于TTS和手动输入功能
-from pydub import AudioSegment
-from pydub.playback import play
-import pygame
+# pygame在AudioPlayer首次播放时才导入并初始化mixer（冷启动可省50-200ms）
+import edge_tts
+
+pygame = None  # 延迟导入，见AudioPlayer._ensure_mixer
+
+# 缓存键哈希：优先使用SIMD加速的blake3（可选依赖），否则回退到hashlib.blake2b
+try:
+    from blake3 import blake3 as _blake3
+
+    def _hash_key(data: bytes) -> bytes:
+        return _blake3(data).digest(length=16)
+except ImportError:
+    def _hash_key(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 常驻后台事件循环：同步入口通过run_coroutine_threadsafe提交协程，
+# 避免每次调用新建事件循环（泄漏selector且在3.10+触发弃用警告）
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """获取（按需启动）常驻后台事件循环"""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever,
+                             name="tts-event-loop", daemon=True).start()
+    return _LOOP
+
 
 class TTSEngine:
     """Text-to-Speech引擎，使用edge-tts实现离线TTS"""
@@ -66,24 +89,38 @@ class TTSEngine:
             pitch=self.pitch
         )
         
-        # 生成音频数据
-        audio_data = b""
+        # 生成音频数据 - bytearray线性追加，避免bytes拼接的O(n^2)拷贝
+        buf = bytearray()
         async for chunk in communicate.stream():
             if chunk["type"] == "audio":
-                audio_data += chunk["data"]
-        
-        return audio_data
+                buf.extend(chunk["data"])
+
+        return bytes(buf)
     
     def text_to_audio(self, text: str, language: str = 'en-US') -> bytes:
         """同步将文本转换为音频数据"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.text_to_audio_async(text, language))
+        future = asyncio.run_coroutine_threadsafe(
+            self.text_to_audio_async(text, language), _get_event_loop())
+        return future.result()
     
+    async def text_to_audio_batch(self, items: List[Tuple[str, str]],
+                                  concurrency: int = 4) -> List[Optional[bytes]]:
+        """并发合成一批(text, language)，在同一事件循环上分摊连接建立开销
+
+        失败的条目返回None，不中断整批合成。
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def synth(text: str, language: str) -> Optional[bytes]:
+            async with semaphore:
+                try:
+                    return await self.text_to_audio_async(text, language)
+                except Exception as e:
+                    logger.warning(f"批量合成失败: {text[:30]}... - {e}")
+                    return None
+
+        return list(await asyncio.gather(*(synth(t, lang) for t, lang in items)))
+
     def save_audio_file(self, text: str, output_path: str, language: str = 'en-US') -> bool:
         """将文本保存为音频文件"""
         try:
@@ -111,20 +148,37 @@ class TTSEngine:
         """获取可用语音列表"""
         async def get_voices():
             return await edge_tts.list_voices()
-        
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        voices = loop.run_until_complete(get_voices())
+
+        future = asyncio.run_coroutine_threadsafe(get_voices(), _get_event_loop())
+        voices = future.result()
         return [{"name": v["Name"], "lang": v["Locale"], "gender": v["Gender"]} for v in voices]
 
 
+# 缓存SQL常量 - 只解析一次
+# 命中路径：一条语句同时更新访问记录并取回路径（SQLite >= 3.35）
+# text_hash已编码language，主键过滤即可，无需附加language条件
+_TOUCH_SQL = """
+    UPDATE audio_cache
+    SET accessed_at = CURRENT_TIMESTAMP, access_count = access_count + 1
+    WHERE text_hash = ?
+    RETURNING file_path
+"""
+_INSERT_SQL = """
+    INSERT OR REPLACE INTO audio_cache
+    (text_hash, text_content, language, file_path, file_size)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# 进程内路径缓存上限
+_CACHE_MAX = 512
+
+# 缓存库schema版本（PRAGMA user_version），不匹配时重建缓存表
+_SCHEMA_VERSION = 2
+
+
 class AudioCache:
     """音频缓存系统"""
-    
+
     def __init__(self, cache_dir: str = "data"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
@@ -132,14 +186,48 @@ class AudioCache:
         self.audio_dir = self.cache_dir / "audio"
         self.audio_dir.mkdir(exist_ok=True)
         self.lock = threading.Lock()
+        # 进程内LRU：热门文本直接返回路径，不走sqlite
+        self._path_cache: "OrderedDict[tuple, str]" = OrderedDict()
         self._init_database()
+        # 复用单个长连接，避免每次查询重新建连、重新应用pragma
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA cache_size=-65536")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        # 序列化编译的sqlite3（threadsafety==3）自行处理跨线程访问，
+        # 只读查询无需再拿进程锁；老编译则复用self.lock——写路径都持有它，
+        # 读写必须落在同一把锁上才能真正互斥
+        self._db_guard = self.lock if sqlite3.threadsafety < 3 else nullcontext()
     
     def _init_database(self):
         """初始化缓存数据库"""
         with sqlite3.connect(self.db_path) as conn:
+            # WAL模式 + 页缓存调优：读写互不阻塞，热索引页常驻内存
+            # page_size只对新建库生效，已有库需VACUUM后才变更；32位主机上mmap会被SQLite自动收缩
+            conn.execute("PRAGMA page_size=8192")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MB页缓存
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MB内存映射
+
+            # schema变更（TEXT主键 -> BLOB主键）时重建缓存表，音频会按需重新生成
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS audio_cache")
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+                # 表一删旧音频文件就没人引用了——清理只认DB行，新文件名
+                # 也换了哈希不会覆盖旧名，不清掉就永远占着磁盘
+                for stale in self.audio_dir.glob("*.mp3"):
+                    try:
+                        stale.unlink()
+                    except OSError as e:
+                        logger.warning(f"清理旧音频缓存失败 {stale.name}: {e}")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS audio_cache (
-                    text_hash TEXT PRIMARY KEY,
+                    text_hash BLOB PRIMARY KEY,
                     text_content TEXT NOT NULL,
                     language TEXT NOT NULL,
                     file_path TEXT NOT NULL,
@@ -149,137 +237,219 @@ class AudioCache:
                     file_size INTEGER DEFAULT 0
                 )
             """)
-            
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_language ON audio_cache(language)
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_created_at ON audio_cache(created_at)
-            """)
+
+            # 查询始终通过text_hash主键定位，单独的language/created_at索引无用
+            conn.execute("DROP INDEX IF EXISTS idx_language")
+            conn.execute("DROP INDEX IF EXISTS idx_created_at")
     
-    def _generate_hash(self, text: str, language: str) -> str:
-        """生成文本和语言的哈希值"""
+    def _remember_path(self, cache_key: tuple, path: str):
+        """记录路径到进程内LRU，超限时淘汰最旧条目"""
+        with self.lock:
+            self._path_cache[cache_key] = path
+            self._path_cache.move_to_end(cache_key)
+            while len(self._path_cache) > _CACHE_MAX:
+                self._path_cache.popitem(last=False)
+
+    def _generate_hash(self, text: str, language: str) -> bytes:
+        """生成文本和语言的16字节哈希，作为BLOB主键存储"""
         combined = f"{language}:{text.strip().lower()}"
-        return hashlib.md5(combined.encode('utf-8')).hexdigest()
+        return _hash_key(combined.encode('utf-8'))
     
     def get_audio_path(self, text: str, language: str = 'en-US') -> Optional[str]:
         """获取缓存的音频文件路径"""
         text_hash = self._generate_hash(text, language)
-        
+        cache_key = (language, text_hash)
+
+        # 先查进程内LRU，命中则完全绕过sqlite
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT file_path FROM audio_cache 
-                    WHERE text_hash = ? AND language = ?
-                """, (text_hash, language))
-                
-                row = cursor.fetchone()
-                if row:
-                    file_path = row[0]
-                    full_path = self.cache_dir / file_path
-                    
-                    if full_path.exists():
-                        # 更新访问记录
-                        conn.execute("""
-                            UPDATE audio_cache 
-                            SET accessed_at = CURRENT_TIMESTAMP, access_count = access_count + 1
-                            WHERE text_hash = ?
-                        """, (text_hash,))
-                        
-                        logger.info(f"音频缓存命中: {text[:30]}...")
-                        return str(full_path)
-                    else:
-                        # 文件不存在，删除缓存记录
-                        conn.execute("DELETE FROM audio_cache WHERE text_hash = ?", (text_hash,))
-        
+            cached = self._path_cache.get(cache_key)
+            if cached is not None:
+                self._path_cache.move_to_end(cache_key)
+        if cached is not None:
+            if os.path.exists(cached):
+                return cached
+            with self.lock:
+                self._path_cache.pop(cache_key, None)
+
+        with self._db_guard:
+            cursor = self._conn.execute(_TOUCH_SQL, (text_hash,))
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+
+        full_path = self.cache_dir / row[0]
+        if full_path.exists():
+            logger.info(f"音频缓存命中: {text[:30]}...")
+            self._remember_path(cache_key, str(full_path))
+            return str(full_path)
+
+        # 文件不存在，删除过期的缓存记录
+        with self._db_guard:
+            self._conn.execute("DELETE FROM audio_cache WHERE text_hash = ?", (text_hash,))
         return None
     
     def cache_audio(self, text: str, audio_data: bytes, language: str = 'en-US') -> str:
         """缓存音频数据并返回文件路径"""
         text_hash = self._generate_hash(text, language)
-        filename = f"{text_hash}.mp3"
+        filename = f"{text_hash.hex()}.mp3"
         file_path = self.audio_dir / filename
         
         with self.lock:
-            # 保存音频文件
-            with open(file_path, 'wb') as f:
-                f.write(audio_data)
-            
+            # 先写临时文件再原子替换，崩溃时不会留下半截mp3
+            tmp_path = file_path.with_suffix('.mp3.tmp')
+            tmp_path.write_bytes(audio_data)
+            os.replace(tmp_path, file_path)
+
             file_size = len(audio_data)
             relative_path = f"audio/{filename}"
-            
+
             # 保存到数据库
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO audio_cache 
-                    (text_hash, text_content, language, file_path, file_size)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (text_hash, text, language, relative_path, file_size))
-        
+            self._conn.execute(_INSERT_SQL,
+                               (text_hash, text, language, relative_path, file_size))
+
+        self._remember_path((language, text_hash), str(file_path))
         logger.info(f"音频已缓存: {text[:30]}... -> {filename}")
+
+        # 机会式清理：约每100次写入清理一小批过期条目，摊薄清理成本
+        if random.randrange(100) == 0:
+            self._cleanup_batch()
+
         return str(file_path)
     
     def get_cache_stats(self) -> Dict:
         """获取缓存统计信息"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*), SUM(file_size) FROM audio_cache")
-            count, total_size = cursor.fetchone()
-            
-            cursor = conn.execute("""
-                SELECT language, COUNT(*), SUM(file_size) 
-                FROM audio_cache 
+        # 一条语句同时取总量与分语言统计（NULL行为总计）
+        with self.lock:
+            rows = self._conn.execute("""
+                SELECT language, COUNT(*), SUM(file_size)
+                FROM audio_cache
                 GROUP BY language
-            """)
-            lang_stats = {}
-            for lang, lang_count, lang_size in cursor.fetchall():
+                UNION ALL
+                SELECT NULL, COUNT(*), SUM(file_size) FROM audio_cache
+            """).fetchall()
+
+        count, total_size = 0, 0
+        lang_stats = {}
+        for lang, lang_count, lang_size in rows:
+            if lang is None:
+                count, total_size = lang_count, lang_size
+            else:
                 lang_stats[lang] = {
                     'count': lang_count,
                     'size_mb': round((lang_size or 0) / (1024 * 1024), 2)
                 }
-            
-            return {
-                'total_files': count or 0,
-                'total_size_mb': round((total_size or 0) / (1024 * 1024), 2),
-                'by_language': lang_stats
-            }
+
+        return {
+            'total_files': count or 0,
+            'total_size_mb': round((total_size or 0) / (1024 * 1024), 2),
+            'by_language': lang_stats
+        }
     
+    def _cleanup_batch(self, days: int = 30, limit: int = 500):
+        """有界清理一批过期条目（写路径上的机会式调用）"""
+        with self.lock:
+            rows = self._conn.execute("""
+                SELECT text_hash, file_path FROM audio_cache
+                WHERE accessed_at < datetime('now', ?)
+                LIMIT ?
+            """, (f'-{days} days', limit)).fetchall()
+
+            if not rows:
+                return
+
+            for _, file_path in rows:
+                try:
+                    os.unlink(str(self.cache_dir / file_path))
+                except FileNotFoundError:
+                    pass
+
+            self._conn.executemany(
+                "DELETE FROM audio_cache WHERE text_hash = ?",
+                [(text_hash,) for text_hash, _ in rows])
+            self._path_cache.clear()
+
+        logger.info(f"机会式清理了 {len(rows)} 个过期音频")
+
     def cleanup_old_cache(self, days: int = 30):
         """清理旧的缓存文件"""
-        from datetime import datetime, timedelta
-        
-        cutoff_date = datetime.now() - timedelta(days=days)
-        
+        # 截止时间直接在SQL里用datetime('now', ?)计算，省去Python侧datetime运算
+        cutoff = f'-{days} days'
+
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT file_path FROM audio_cache 
-                    WHERE accessed_at < ?
-                """, (cutoff_date.isoformat(),))
-                
-                old_files = cursor.fetchall()
-                
-                for (file_path,) in old_files:
-                    full_path = self.cache_dir / file_path
-                    if full_path.exists():
-                        full_path.unlink()
-                
-                conn.execute("""
-                    DELETE FROM audio_cache 
-                    WHERE accessed_at < ?
-                """, (cutoff_date.isoformat(),))
-                
-                logger.info(f"清理了 {len(old_files)} 个旧音频文件")
+            cursor = self._conn.execute("""
+                SELECT file_path FROM audio_cache
+                WHERE accessed_at < datetime('now', ?)
+            """, (cutoff,))
+
+            old_files = [str(self.cache_dir / file_path)
+                         for (file_path,) in cursor.fetchall()]
+
+            # 直接unlink并吞掉不存在的情况，省去每个文件的exists()系统调用
+            for path in old_files:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+            self._conn.execute("""
+                DELETE FROM audio_cache
+                WHERE accessed_at < datetime('now', ?)
+            """, (cutoff,))
+
+            # 磁盘文件已删除，进程内路径缓存随之失效
+            self._path_cache.clear()
+
+            logger.info(f"清理了 {len(old_files)} 个旧音频文件")
 
 
 class AudioPlayer:
     """音频播放器"""
     
     def __init__(self):
-        pygame.mixer.init()
         self.current_audio = None
         self.is_playing = False
         self.volume = 0.7
-        pygame.mixer.music.set_volume(self.volume)
+        self._mixer_ready = False
+        # 解码后的Sound对象按路径缓存，重播同一单词时跳过mp3解码
+        self._sound_cache: "OrderedDict[str, object]" = OrderedDict()
+        self._sound_cache_max = 64
+        self._channel = None
+        # 单个常驻监听线程替代每次播放新建线程
+        self._end_callback: Optional[Callable] = None
+        self._monitor_wakeup = threading.Event()
+        threading.Thread(target=self._monitor_loop,
+                         name="audio-monitor", daemon=True).start()
+
+    def _ensure_mixer(self):
+        """首次播放时才导入pygame并初始化mixer"""
+        if not self._mixer_ready:
+            global pygame
+            import pygame
+            pygame.mixer.init()
+            pygame.mixer.music.set_volume(self.volume)
+            self._mixer_ready = True
+
+    def _is_busy(self) -> bool:
+        """当前是否有音频（Sound通道或music流）在播放"""
+        if self._channel is not None and self._channel.get_busy():
+            return True
+        return pygame.mixer.music.get_busy()
+
+    def _monitor_loop(self):
+        """常驻播放监听线程：等待播放开始，结束后触发回调"""
+        while True:
+            self._monitor_wakeup.wait()
+            self._monitor_wakeup.clear()
+            while self._is_busy():
+                time.sleep(0.05)
+            self.is_playing = False
+            callback, self._end_callback = self._end_callback, None
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"播放完成回调失败: {e}")
     
     def play_audio_file(self, file_path: str, callback: Callable = None) -> bool:
         """播放音频文件"""
@@ -287,25 +457,30 @@ class AudioPlayer:
             if not os.path.exists(file_path):
                 logger.error(f"音频文件不存在: {file_path}")
                 return False
-            
+
+            self._ensure_mixer()
             self.stop_audio()
-            
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
+
+            snd = self._sound_cache.get(file_path)
+            if snd is None:
+                snd = pygame.mixer.Sound(file_path)
+                self._sound_cache[file_path] = snd
+                while len(self._sound_cache) > self._sound_cache_max:
+                    self._sound_cache.popitem(last=False)
+            else:
+                self._sound_cache.move_to_end(file_path)
+
+            self._channel = snd.play()
+            if self._channel is not None:
+                self._channel.set_volume(self.volume)
             self.is_playing = True
-            
+
             logger.info(f"开始播放音频: {os.path.basename(file_path)}")
-            
-            # 如果有回调函数，启动监听线程
-            if callback:
-                def monitor_playback():
-                    while pygame.mixer.music.get_busy():
-                        time.sleep(0.1)
-                    self.is_playing = False
-                    callback()
-                
-                threading.Thread(target=monitor_playback, daemon=True).start()
-            
+
+            # 唤醒常驻监听线程处理播放结束
+            self._end_callback = callback
+            self._monitor_wakeup.set()
+
             return True
         except Exception as e:
             logger.error(f"播放音频失败: {e}")
@@ -315,59 +490,66 @@ class AudioPlayer:
     def play_audio_data(self, audio_data: bytes, callback: Callable = None) -> bool:
         """播放音频数据"""
         try:
-            # 将音频数据写入临时文件
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                temp_file.write(audio_data)
-                temp_path = temp_file.name
-            
-            result = self.play_audio_file(temp_path, callback)
-            
-            # 播放完成后删除临时文件
-            def cleanup():
-                time.sleep(1)  # 等待播放完成
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
-            
-            threading.Thread(target=cleanup, daemon=True).start()
-            
-            return result
+            self._ensure_mixer()
+            self.stop_audio()
+
+            # pygame支持file-like对象，直接从内存播放，无需临时文件
+            pygame.mixer.music.load(io.BytesIO(audio_data))
+            pygame.mixer.music.play()
+            self.is_playing = True
+
+            logger.info(f"开始播放内存音频 ({len(audio_data)} 字节)")
+
+            self._end_callback = callback
+            self._monitor_wakeup.set()
+
+            return True
         except Exception as e:
             logger.error(f"播放音频数据失败: {e}")
+            self.is_playing = False
             return False
     
     def stop_audio(self):
         """停止音频播放"""
         if self.is_playing:
+            if self._channel is not None:
+                self._channel.stop()
             pygame.mixer.music.stop()
             self.is_playing = False
             logger.info("音频播放已停止")
-    
+
     def pause_audio(self):
         """暂停音频播放"""
         if self.is_playing:
+            if self._channel is not None:
+                self._channel.pause()
             pygame.mixer.music.pause()
             logger.info("音频播放已暂停")
     
     def resume_audio(self):
         """恢复音频播放"""
-        pygame.mixer.music.unpause()
-        logger.info("音频播放已恢复")
-    
+        if self._mixer_ready:
+            if self._channel is not None:
+                self._channel.unpause()
+            pygame.mixer.music.unpause()
+            logger.info("音频播放已恢复")
+
     def set_volume(self, volume: float):
         """设置音量 (0.0 - 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.volume)
+        if self._mixer_ready:
+            if self._channel is not None:
+                self._channel.set_volume(self.volume)
+            pygame.mixer.music.set_volume(self.volume)
         logger.info(f"音量已设置为: {self.volume:.1f}")
-    
+
     def get_volume(self) -> float:
         """获取当前音量"""
         return self.volume
-    
+
     def is_audio_playing(self) -> bool:
         """检查是否正在播放音频"""
-        return self.is_playing and pygame.mixer.music.get_busy()
+        return self.is_playing and self._is_busy()
 
 
 class AudioRecorder:
@@ -428,6 +610,9 @@ class ListenEngine:
         self.current_text = ""
         self.current_language = "en-US"
         self.playback_callback = None
+        # 失败负缓存：短时间内不重复合成已知失败的文本
+        self._failed_texts: Dict[tuple, float] = {}
+        self._failed_ttl = 300.0
     
     def play_text(self, text: str, language: str = 'en-US', callback: Callable = None) -> bool:
         """播放文本语音"""
@@ -440,13 +625,25 @@ class ListenEngine:
         if cached_path:
             return self.player.play_audio_file(cached_path, callback)
         
-        # 缓存不存在，生成音频
+        # 最近合成失败过的文本在TTL内直接跳过，避免反复走完整的失败流程
+        failed_at = self._failed_texts.get((language, text))
+        if failed_at is not None:
+            if time.monotonic() - failed_at < self._failed_ttl:
+                logger.warning(f"跳过近期合成失败的文本: {text[:30]}...")
+                return False
+            del self._failed_texts[(language, text)]
+
+        # 缓存不存在，生成音频；先从内存开始播放，缓存写入放到后台线程，
+        # 缩短从合成完成到出声的延迟
         try:
             audio_data = self.tts_engine.text_to_audio(text, language)
-            cached_path = self.audio_cache.cache_audio(text, audio_data, language)
-            return self.player.play_audio_file(cached_path, callback)
+            result = self.player.play_audio_data(audio_data, callback)
+            threading.Thread(target=self.audio_cache.cache_audio,
+                             args=(text, audio_data, language), daemon=True).start()
+            return result
         except Exception as e:
             logger.error(f"播放文本失败: {e}")
+            self._failed_texts[(language, text)] = time.monotonic()
             return False
     
     def replay_current(self) -> bool:
@@ -484,11 +681,12 @@ class ListenEngine:
         original_words = original.lower().split()
         recognized_words = recognized.lower().split()
         
-        # 计算相似度
+        # 计算相似度 - frozenset成员判断为O(1)，避免逐词线性扫描
         if not original_words:
             similarity = 0.0
         else:
-            correct_words = sum(1 for word in recognized_words if word in original_words)
+            original_set = frozenset(original_words)
+            correct_words = sum(1 for word in recognized_words if word in original_set)
             similarity = correct_words / len(original_words) * 100
         
         return {
@@ -500,6 +698,36 @@ class ListenEngine:
             'recognized_count': len(recognized_words)
         }
     
+    def compare_texts_batch(self, pairs: List[Tuple[str, str]]) -> List[Dict]:
+        """批量比较(原文, 识别文本)对，用numpy.isin向量化词匹配
+
+        单次比较仍走compare_texts；批量导出/评分场景用此接口。
+        """
+        import numpy as np
+
+        results = []
+        for original, recognized in pairs:
+            original_words = original.lower().split()
+            recognized_words = recognized.lower().split()
+
+            if not original_words:
+                similarity = 0.0
+            else:
+                ref = np.array(original_words)
+                hyp = np.array(recognized_words) if recognized_words else np.array([], dtype=str)
+                correct_words = int(np.isin(hyp, ref).sum())
+                similarity = correct_words / len(original_words) * 100
+
+            results.append({
+                'original': original,
+                'recognized': recognized,
+                'similarity': round(similarity, 2),
+                'is_correct': similarity >= 80.0,
+                'word_count': len(original_words),
+                'recognized_count': len(recognized_words)
+            })
+        return results
+
     def set_tts_parameters(self, rate: str = None, volume: str = None, pitch: str = None):
         """设置TTS参数"""
         self.tts_engine.set_voice_parameters(rate, volume, pitch)
@@ -512,20 +740,28 @@ class ListenEngine:
         """获取缓存统计信息"""
         return self.audio_cache.get_cache_stats()
     
+    async def _preload_async(self, texts: List[str], language: str = 'en-US',
+                             concurrency: int = 4):
+        """并发预加载未缓存的音频，信号量限制并发数避免滥用TTS服务"""
+        pending = [text for text in texts
+                   if not self.audio_cache.get_audio_path(text, language)]
+        if not pending:
+            return
+
+        results = await self.tts_engine.text_to_audio_batch(
+            [(text, language) for text in pending], concurrency=concurrency)
+        for text, audio_data in zip(pending, results):
+            if audio_data:
+                await asyncio.to_thread(self.audio_cache.cache_audio,
+                                        text, audio_data, language)
+
     def preload_audio(self, texts: List[str], language: str = 'en-US'):
         """预加载音频"""
         def preload_task():
             logger.info(f"开始预加载 {len(texts)} 个音频...")
-            for text in texts:
-                if not self.audio_cache.get_audio_path(text, language):
-                    try:
-                        audio_data = self.tts_engine.text_to_audio(text, language)
-                        self.audio_cache.cache_audio(text, audio_data, language)
-                        time.sleep(0.1)  # 避免过于频繁
-                    except Exception as e:
-                        logger.warning(f"预加载音频失败: {text[:30]}... - {e}")
+            asyncio.run(self._preload_async(texts, language))
             logger.info("音频预加载完成")
-        
+
         preload_thread = threading.Thread(target=preload_task, daemon=True)
         preload_thread.start()
     
@@ -536,12 +772,15 @@ class ListenEngine:
 
 # 全局听写引擎实例
 _listen_engine = None
+_listen_engine_lock = threading.Lock()
 
 def get_listen_engine(cache_dir: str = "data") -> ListenEngine:
-    """获取全局听写引擎实例"""
+    """获取全局听写引擎实例（双重检查加锁，避免并发初始化出两份）"""
     global _listen_engine
     if _listen_engine is None:
-        _listen_engine = ListenEngine(cache_dir)
+        with _listen_engine_lock:
+            if _listen_engine is None:
+                _listen_engine = ListenEngine(cache_dir)
     return _listen_engine
 
 
@@ -72,8 +72,8 @@ def main():
     python_version = sys.version_info
     print(f"🐍 Python版本: {python_version.major}.{python_version.minor}.{python_version.micro}")
     
-    if python_version < (3, 8):
-        print("❌ Python版本过低，需要3.8+")
+    if python_version < (3, 10):
+        print("❌ Python版本过低，需要3.10+")
         return False
     
     print("\n📦 测试第三方依赖...")
@@ -131,7 +131,7 @@ def main():
         print("\n🛠️ 解决方案:")
         print("1. 确保在虚拟环境中运行")
         print("2. 重新安装依赖: pip install -r requirements-basic.txt")
-        print("3. 检查Python版本是否为3.8+")
+        print("3. 检查Python版本是否为3.10+")
     
     return total_success
 
@@ -904,8 +904,13 @@ class MainApplication:
             title="导出学习进度"
         )
         
-        if file_path and self.core.data_manager.save_progress():
-            messagebox.showinfo("成功", "学习进度已导出")
+        if file_path:
+            # 导出是显式操作，等后台写盘真正完成再报结果
+            self.core.data_manager.save_progress()
+            if self.core.data_manager.flush_saves():
+                messagebox.showinfo("成功", "学习进度已导出")
+            else:
+                messagebox.showerror("错误", "学习进度导出失败")
     
     def _show_audio_settings(self):
         """显示音频设置"""
@@ -950,8 +955,9 @@ class MainApplication:
     def _on_closing(self):
         """程序关闭事件"""
         if messagebox.askokcancel("退出", "确定要退出程序吗？"):
-            # 保存进度
+            # 保存进度，并等后台线程写完再销毁窗口
             self.core.data_manager.save_progress()
+            self.core.data_manager.flush_saves()
             self.root.destroy()
     
     def run(self):